@@ -25,16 +25,25 @@ Usage:
 
 """
 
+import asyncio
 import io
+import math
 import os
 import re
 from contextlib import asynccontextmanager
+from functools import lru_cache
 from typing import Optional
 
-import pandas as pd
+import numpy as np
+import orjson
+import xlsxwriter
 from fastapi import Depends, FastAPI, Header, HTTPException, status
-from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
+from fastapi.responses import HTMLResponse, JSONResponse, Response
 from pydantic import BaseModel, Field
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.platypus import Paragraph, SimpleDocTemplate, Table, TableStyle
 
 import agent
 import database
@@ -76,6 +85,18 @@ class LoginRequest(BaseModel):
     password: str
 
 
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib encoder.
+
+    FastAPI's own ``ORJSONResponse`` is deprecated in favour of response
+    models; our handlers return small dicts directly, so we keep the
+    fast renderer here.
+    """
+
+    def render(self, content: object) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
 _BEARER_AUTHORIZATION = re.compile(r"(?i:bearer) ([A-Za-z0-9_-]{43})")
 
 
@@ -100,38 +121,40 @@ def require_user(
 # Utility functions
 ###############################################################################
 
-def create_projection(inputs: ProFormaInput) -> pd.DataFrame:
-    """Create a very simple projection DataFrame from user inputs.
+def create_projection(inputs: ProFormaInput, months: int = 12) -> dict[str, np.ndarray]:
+    """Create a very simple projection from user inputs.
 
-    The projection covers 12 months, applying a constant growth rate to
-    the monthly revenue.  Gross margin is applied to compute gross
-    profit, and CAC is aggregated separately for demonstration
-    purposes.  In a real model you'd have more sophisticated logic.
+    The projection covers ``months`` months (12 by default), applying a
+    constant growth rate to the monthly revenue.  Gross margin is applied
+    to compute gross profit, and CAC is aggregated separately for
+    demonstration purposes.  In a real model you'd have more
+    sophisticated logic.  Columns are returned as NumPy arrays keyed by
+    name, which ``database.save_model`` stores without building a
+    DataFrame first.
     """
-    months = list(range(1, 13))
-    revenue = []
-    current = inputs.monthly_revenue
-    for _ in months:
-        revenue.append(current)
-        current *= 1 + inputs.growth_rate
-    gross_profit = [rev * inputs.gross_margin for rev in revenue]
-    cac_total = [inputs.cac] * len(months)
-    df = pd.DataFrame({
-        "month": months,
+    periods = np.arange(months)
+    revenue = inputs.monthly_revenue * (1 + inputs.growth_rate) ** periods
+    return {
+        "month": periods + 1,
         "revenue": revenue,
-        "gross_profit": gross_profit,
-        "cac": cac_total,
-    })
-    return df
+        "gross_profit": revenue * inputs.gross_margin,
+        "cac": np.full(months, inputs.cac),
+    }
+
+
+_TEMPLATES: dict[str, str] = {}
+
 
 def ensure_templates_loaded() -> None:
-    """Ensure that the templates folder exists and contains basic files.
+    """Ensure that the templates folder exists and load it into memory.
 
     If the expected HTML files don't exist (for example, when running
     locally from a fresh checkout), we create minimal placeholder
     versions so that the /marketing, /auth and /dashboard pages don't
     raise 404 errors.  These placeholders can be replaced with real
-    designs as soon as they are available.
+    designs as soon as they are available.  Every template is then read
+    once into ``_TEMPLATES`` so the page handlers don't touch the disk;
+    edits to the files take effect on the next restart.
     """
     tpl_dir = os.path.join(os.path.dirname(__file__), "templates")
     os.makedirs(tpl_dir, exist_ok=True)
@@ -145,6 +168,10 @@ def ensure_templates_loaded() -> None:
         if not os.path.exists(path):
             with open(path, "w", encoding="utf-8") as fh:
                 fh.write(content)
+            _TEMPLATES[name] = content
+        else:
+            with open(path, "r", encoding="utf-8") as fh:
+                _TEMPLATES[name] = fh.read()
 
 ###############################################################################
 # Route handlers
@@ -158,26 +185,27 @@ async def lifespan(_: FastAPI):
     yield
 
 
-app = FastAPI(title="Your Proforma Sucks API", version="0.1.0", lifespan=lifespan)
+app = FastAPI(
+    title="Your Proforma Sucks API",
+    version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 
-@app.get("/marketing", response_class=HTMLResponse)
+@app.get("/marketing", response_class=HTMLResponse, response_model=None)
 async def marketing_page() -> str:
     """Serve the marketing landing page."""
-    tpl_path = os.path.join(os.path.dirname(__file__), "templates", "marketing.html")
-    with open(tpl_path, "r", encoding="utf-8") as fh:
-        return fh.read()
+    return _TEMPLATES["marketing.html"]
 
 
-@app.get("/auth", response_class=HTMLResponse)
+@app.get("/auth", response_class=HTMLResponse, response_model=None)
 async def auth_page() -> str:
     """Serve the login/registration page."""
-    tpl_path = os.path.join(os.path.dirname(__file__), "templates", "auth.html")
-    with open(tpl_path, "r", encoding="utf-8") as fh:
-        return fh.read()
+    return _TEMPLATES["auth.html"]
 
 
-@app.get("/dashboard", response_class=HTMLResponse)
+@app.get("/dashboard", response_class=HTMLResponse, response_model=None)
 async def dashboard_page(user: Optional[str] = None) -> str:
     """Serve the user dashboard page.
 
@@ -185,110 +213,149 @@ async def dashboard_page(user: Optional[str] = None) -> str:
     ``user`` parameter or session information to display saved models.
     For the MVP we simply return a static page.
     """
-    tpl_path = os.path.join(os.path.dirname(__file__), "templates", "dashboard.html")
-    with open(tpl_path, "r", encoding="utf-8") as fh:
-        return fh.read()
+    return _TEMPLATES["dashboard.html"]
 
 
-@app.post("/register")
-async def register(request: RegistrationRequest) -> JSONResponse:
+@app.post("/register", response_model=None)
+async def register(request: RegistrationRequest) -> ORJSONResponse:
     """Register a new user in the database."""
-    success = database.create_user(request.username, request.password)
+    success = await asyncio.to_thread(database.create_user, request.username, request.password)
     if not success:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="User already exists")
-    return JSONResponse({"message": "User registered successfully"})
+    return ORJSONResponse({"message": "User registered successfully"})
 
 
-@app.post("/login")
-async def login(request: LoginRequest) -> JSONResponse:
+@app.post("/login", response_model=None)
+async def login(request: LoginRequest) -> ORJSONResponse:
     """Authenticate a user and return a short-lived opaque session token."""
-    if not database.authenticate_user(request.username, request.password):
+    if not await asyncio.to_thread(database.authenticate_user, request.username, request.password):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
-    token = database.create_session(request.username)
-    return JSONResponse({"token": token})
+    token = await asyncio.to_thread(database.create_session, request.username)
+    return ORJSONResponse({"token": token})
 
 
-@app.post("/generate")
-async def generate_proforma(inputs: ProFormaInput, user: str = Depends(require_user)) -> JSONResponse:
+@app.post("/generate", response_model=None)
+async def generate_proforma(inputs: ProFormaInput, user: str = Depends(require_user)) -> ORJSONResponse:
     """Generate a simple pro forma and persist it.
 
     Returns a model identifier that can be used to fetch the model
-    later or request a roast.  The DataFrame is stored in the
-    database as a binary blob (in CSV format) for simplicity.
+    later or request a roast.  The projection is stored in the
+    database as a binary blob (an Arrow IPC stream).
     """
-    df = create_projection(inputs)
-    model_id = database.save_model(user, df)
-    return JSONResponse({"model_id": model_id, "message": "Model generated successfully"})
+    projection = create_projection(inputs)
+    model_id = await asyncio.to_thread(database.save_model, user, projection)
+    return ORJSONResponse({"model_id": model_id, "message": "Model generated successfully"})
 
 
-@app.get("/export/xlsx/{model_id}")
-async def export_xlsx(model_id: str, user: str = Depends(require_user)) -> StreamingResponse:
-    """Export a saved model to XLSX and return it as a download."""
+_XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+
+def _xlsx_cell(value: object) -> object:
+    """Map NaN to a blank cell and infinities to text, as pandas' to_excel did.
+
+    xlsxwriter refuses to write non-finite numbers.
+    """
+    if isinstance(value, float) and not math.isfinite(value):
+        if math.isnan(value):
+            return None
+        return "inf" if value > 0 else "-inf"
+    return value
+
+
+@lru_cache(maxsize=256)
+def _render_xlsx(model_id: str, user: str) -> bytes:
+    """Render a saved model as XLSX bytes.
+
+    Saved models never change, so renders are cached per model and owner.
+    A missing model raises rather than returning, which keeps misses out
+    of the cache.
+    """
     df = database.load_model(model_id, user)
     if df is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Model not found")
-    # Write DataFrame to Excel in memory
+    # Write the rows straight to an in-memory workbook; pandas' to_excel
+    # adds per-cell styling work that a plain values table doesn't need.
     out = io.BytesIO()
-    with pd.ExcelWriter(out, engine="xlsxwriter") as writer:
-        df.to_excel(writer, index=False, sheet_name="ProForma")
-    out.seek(0)
-    filename = f"proforma_{model_id}.xlsx"
-    return StreamingResponse(
-        out,
-        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
-    )
-
-
-@app.get("/export/pdf/{model_id}")
-async def export_pdf(model_id: str, user: str = Depends(require_user)) -> StreamingResponse:
-    """Export a saved model to PDF and return it as a download.
-
-    For the MVP we generate a very simple PDF by converting the
-    DataFrame to an HTML table and then to PDF using PyMuPDF.  This
-    produces a flat document without charts or styling.  You can
-    enhance this function later to use reportlab or WeasyPrint for
-    richer output.
+    workbook = xlsxwriter.Workbook(out, {"in_memory": True})
+    worksheet = workbook.add_worksheet("ProForma")
+    worksheet.write_row(0, 0, df.columns.tolist(), workbook.add_format({"bold": True}))
+    for row_idx, row in enumerate(df.itertuples(index=False, name=None), start=1):
+        worksheet.write_row(row_idx, 0, [_xlsx_cell(value) for value in row])
+    workbook.close()
+    return out.getvalue()
+
+
+@lru_cache(maxsize=256)
+def _render_pdf(model_id: str, user: str) -> bytes:
+    """Render a saved model as PDF bytes, cached like ``_render_xlsx``.
+
+    For the MVP we draw the DataFrame as a single ReportLab table under a
+    title.  This produces a flat document without charts; richer output
+    can be layered on with more platypus flowables later.
     """
     df = database.load_model(model_id, user)
     if df is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Model not found")
-    import fitz  # PyMuPDF
-    # Create a simple HTML representation
-    html_table = df.to_html(index=False)
-    doc = fitz.open()
-    page = doc.new_page(width=595, height=842)  # A4
-    text = f"<h1>Pro Forma {model_id}</h1>" + html_table
-    page.insert_html(text)
-    pdf_bytes = doc.write()
-    doc.close()
-    filename = f"proforma_{model_id}.pdf"
-    return StreamingResponse(
-        io.BytesIO(pdf_bytes),
+    data = [df.columns.tolist()] + df.round(2).astype(object).values.tolist()
+    table = Table(data, repeatRows=1)
+    table.setStyle(TableStyle([
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("LINEBELOW", (0, 0), (-1, 0), 0.5, colors.black),
+        ("ALIGN", (0, 1), (-1, -1), "RIGHT"),
+    ]))
+    out = io.BytesIO()
+    doc = SimpleDocTemplate(out, pagesize=A4, title=f"Pro Forma {model_id}")
+    doc.build([Paragraph(f"Pro Forma {model_id}", getSampleStyleSheet()["Heading1"]), table])
+    return out.getvalue()
+
+
+def _download_headers(filename: str) -> dict[str, str]:
+    # Exports are per-user, so only the client may cache them.
+    return {
+        "Content-Disposition": f'attachment; filename="{filename}"',
+        "Cache-Control": "private, max-age=3600",
+    }
+
+
+@app.get("/export/xlsx/{model_id}", response_model=None)
+async def export_xlsx(model_id: str, user: str = Depends(require_user)) -> Response:
+    """Export a saved model to XLSX and return it as a download."""
+    return Response(
+        content=await asyncio.to_thread(_render_xlsx, model_id, user),
+        media_type=_XLSX_MEDIA_TYPE,
+        headers=_download_headers(f"proforma_{model_id}.xlsx"),
+    )
+
+
+@app.get("/export/pdf/{model_id}", response_model=None)
+async def export_pdf(model_id: str, user: str = Depends(require_user)) -> Response:
+    """Export a saved model to PDF and return it as a download."""
+    return Response(
+        content=await asyncio.to_thread(_render_pdf, model_id, user),
         media_type="application/pdf",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        headers=_download_headers(f"proforma_{model_id}.pdf"),
     )
 
 
-@app.post("/roast")
-async def roast(request: RoastRequest, user: str = Depends(require_user)) -> JSONResponse:
+@app.post("/roast", response_model=None)
+async def roast(request: RoastRequest, user: str = Depends(require_user)) -> ORJSONResponse:
     """Send a pro forma or summary to the AI agent and return the critique."""
     summary = request.summary
     if request.model_id:
-        df = database.load_model(request.model_id, user)
+        df = await asyncio.to_thread(database.load_model, request.model_id, user)
         if df is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Model not found")
         # Derive a textual summary from the DataFrame (very naive)
-        total_revenue = df["revenue"].sum()
+        total_revenue = float(df["revenue"].to_numpy().sum())
         summary = summary or f"A 12‑month projection with total revenue of ${total_revenue:,.0f}."
     if not summary:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Summary or model_id required")
-    critique = agent.roast(summary)
-    return JSONResponse({"critique": critique})
+    critique = await asyncio.to_thread(agent.roast, summary)
+    return ORJSONResponse({"critique": critique})
 
 
-@app.post("/partner-request")
-async def partner_request(name: str, email: str, message: str) -> JSONResponse:
+@app.post("/partner-request", response_model=None)
+async def partner_request(name: str, email: str, message: str) -> ORJSONResponse:
     """Store an accelerator/agency/VC inquiry in the database."""
-    database.save_partner_request(name, email, message)
-    return JSONResponse({"message": "Partner request submitted"})
+    await asyncio.to_thread(database.save_partner_request, name, email, message)
+    return ORJSONResponse({"message": "Partner request submitted"})
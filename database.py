@@ -11,12 +11,16 @@ import hmac
 import os
 import secrets
 import sqlite3
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 from io import StringIO
 from pathlib import Path
-from typing import Optional
+from typing import Any, Iterable, Iterator, Mapping, Optional
 
 import pandas as pd
+import pyarrow as pa
+from cachetools import LRUCache, TTLCache
 
 DB_PATH = Path(os.path.dirname(__file__)) / "app.db"
 _SCRYPT_N = 2**14
@@ -24,6 +28,36 @@ _SCRYPT_R = 8
 _SCRYPT_P = 1
 _SESSION_TTL_HOURS = 12
 _SQLITE_BUSY_TIMEOUT_MS = 120_000
+_SQLITE_CACHE_SIZE_KIB = 65_536
+_AUTH_CACHE_TTL_SECONDS = 5
+
+# Successful logins are remembered briefly so bursts of repeat logins skip the
+# scrypt check. Keys hold a keyed digest of the password, never the password.
+_auth_cache: TTLCache = TTLCache(maxsize=1024, ttl=_AUTH_CACHE_TTL_SECONDS)
+_auth_cache_key = secrets.token_bytes(32)
+_auth_cache_lock = threading.Lock()
+
+# Saved models are immutable, so decoded frames are kept by id along with
+# their owner; the owner check still applies on every hit.
+_model_cache: LRUCache = LRUCache(maxsize=256)
+_model_cache_lock = threading.Lock()
+
+# One long-lived connection serves request-time queries; the lock serializes
+# access so each caller gets its own transaction on it.
+_shared_connection: Optional[sqlite3.Connection] = None
+_shared_connection_path: Optional[Path] = None
+_shared_connection_lock = threading.Lock()
+
+# Request-time statements. Keeping the text identical on every call lets the
+# shared connection's statement cache skip re-preparing them.
+_SQL_INSERT_USER = "INSERT INTO users (username, password_hash) VALUES (?, ?)"
+_SQL_SELECT_PASSWORD_HASH = "SELECT password_hash FROM users WHERE username = ?"
+_SQL_INSERT_SESSION = "INSERT INTO sessions (token_hash, username, expires_at) VALUES (?, ?, ?)"
+_SQL_SELECT_SESSION = "SELECT username, expires_at FROM sessions WHERE token_hash = ?"
+_SQL_DELETE_SESSION = "DELETE FROM sessions WHERE token_hash = ?"
+_SQL_INSERT_MODEL = "INSERT INTO models (id, username, data) VALUES (?, ?, ?)"
+_SQL_SELECT_MODEL = "SELECT data FROM models WHERE id = ? AND username = ?"
+_SQL_INSERT_PARTNER_REQUEST = "INSERT INTO partner_requests (name, email, message) VALUES (?, ?, ?)"
 
 
 class LegacyCredentialMigrationError(RuntimeError):
@@ -39,10 +73,46 @@ def get_connection() -> sqlite3.Connection:
     connection.execute("PRAGMA foreign_keys = ON")
     connection.execute(f"PRAGMA busy_timeout = {_SQLITE_BUSY_TIMEOUT_MS}")
     connection.execute("PRAGMA secure_delete = ON")
+    connection.execute("PRAGMA journal_mode = WAL")
+    connection.execute("PRAGMA synchronous = NORMAL")
+    connection.execute("PRAGMA temp_store = MEMORY")
+    connection.execute(f"PRAGMA cache_size = -{_SQLITE_CACHE_SIZE_KIB}")
     return connection
 
 
+def _close_shared_connection() -> None:
+    global _shared_connection, _shared_connection_path
+    with _shared_connection_lock:
+        if _shared_connection is not None:
+            _shared_connection.close()
+        _shared_connection = None
+        _shared_connection_path = None
+
+
+@contextmanager
+def _connection() -> Iterator[sqlite3.Connection]:
+    """Yield the shared connection inside a transaction, holding its lock.
+
+    The connection is reopened if ``DB_PATH`` changed since it was created.
+    """
+    global _shared_connection, _shared_connection_path
+    with _shared_connection_lock:
+        if _shared_connection is None or _shared_connection_path != DB_PATH:
+            if _shared_connection is not None:
+                _shared_connection.close()
+            _shared_connection = get_connection()
+            _shared_connection_path = DB_PATH
+        with _shared_connection as connection:
+            yield connection
+
+
 def init_db() -> None:
+    # Startup may replace the database file, so drop any connection to the old
+    # one and forget logins and models read from it.
+    _close_shared_connection()
+    _clear_auth_cache()
+    with _model_cache_lock:
+        _model_cache.clear()
     with get_connection() as connection:
         connection.execute("BEGIN IMMEDIATE")
         connection.execute(
@@ -66,11 +136,17 @@ def init_db() -> None:
             CREATE TABLE IF NOT EXISTS models (
                 id TEXT PRIMARY KEY,
                 username TEXT NOT NULL,
-                csv_data TEXT NOT NULL,
+                data BLOB NOT NULL,
                 FOREIGN KEY (username) REFERENCES users(username)
             )
             """
         )
+        model_columns = {
+            row[1] for row in connection.execute("PRAGMA table_info(models)").fetchall()
+        }
+        if "csv_data" in model_columns:
+            # Legacy rows keep their CSV text; _decode_model falls back to it.
+            connection.execute("ALTER TABLE models RENAME COLUMN csv_data TO data")
         connection.execute(
             """
             CREATE TABLE IF NOT EXISTS sessions (
@@ -119,15 +195,16 @@ def _verify_password(password: str, encoded: str) -> bool:
         algorithm, n, r, p, salt_hex, expected_hex = encoded.split("$", 5)
         if algorithm != "scrypt":
             return False
+        expected = bytes.fromhex(expected_hex)
         actual = hashlib.scrypt(
             password.encode("utf-8"),
             salt=bytes.fromhex(salt_hex),
             n=int(n),
             r=int(r),
             p=int(p),
-            dklen=len(bytes.fromhex(expected_hex)),
+            dklen=len(expected),
         )
-        return hmac.compare_digest(actual.hex(), expected_hex)
+        return hmac.compare_digest(actual, expected)
     except (TypeError, ValueError):
         return False
 
@@ -206,33 +283,43 @@ def _migrate_legacy_passwords(connection: sqlite3.Connection) -> int:
 def create_user(username: str, password: str) -> bool:
     password_hash = _hash_password(password)
     try:
-        with get_connection() as connection:
-            connection.execute(
-                "INSERT INTO users (username, password_hash) VALUES (?, ?)",
-                (username, password_hash),
-            )
+        with _connection() as connection:
+            connection.execute(_SQL_INSERT_USER, (username, password_hash))
         return True
     except sqlite3.IntegrityError:
         return False
 
 
+def _clear_auth_cache() -> None:
+    """Forget cached logins; call whenever stored credentials change."""
+    with _auth_cache_lock:
+        _auth_cache.clear()
+
+
 def authenticate_user(username: str, password: str) -> bool:
-    with get_connection() as connection:
-        row = connection.execute(
-            "SELECT password_hash FROM users WHERE username = ?",
-            (username,),
-        ).fetchone()
-    return bool(row and row[0] and _verify_password(password, row[0]))
+    cache_key = (
+        username,
+        hmac.new(_auth_cache_key, password.encode("utf-8"), hashlib.sha256).digest(),
+    )
+    with _auth_cache_lock:
+        if cache_key in _auth_cache:
+            return True
+    with _connection() as connection:
+        row = connection.execute(_SQL_SELECT_PASSWORD_HASH, (username,)).fetchone()
+    authenticated = bool(row and row[0] and _verify_password(password, row[0]))
+    if authenticated:
+        with _auth_cache_lock:
+            _auth_cache[cache_key] = True
+    return authenticated
 
 
 def create_session(username: str) -> str:
     token = secrets.token_urlsafe(32)
     token_hash = hashlib.sha256(token.encode("utf-8")).hexdigest()
     expires_at = datetime.now(timezone.utc) + timedelta(hours=_SESSION_TTL_HOURS)
-    with get_connection() as connection:
+    with _connection() as connection:
         connection.execute(
-            "INSERT INTO sessions (token_hash, username, expires_at) VALUES (?, ?, ?)",
-            (token_hash, username, expires_at.isoformat()),
+            _SQL_INSERT_SESSION, (token_hash, username, expires_at.isoformat())
         )
     return token
 
@@ -240,11 +327,8 @@ def create_session(username: str) -> str:
 def resolve_session(token: str) -> Optional[str]:
     token_hash = hashlib.sha256(token.encode("utf-8")).hexdigest()
     now = datetime.now(timezone.utc)
-    with get_connection() as connection:
-        row = connection.execute(
-            "SELECT username, expires_at FROM sessions WHERE token_hash = ?",
-            (token_hash,),
-        ).fetchone()
+    with _connection() as connection:
+        row = connection.execute(_SQL_SELECT_SESSION, (token_hash,)).fetchone()
         if row is None:
             return None
         try:
@@ -252,33 +336,66 @@ def resolve_session(token: str) -> Optional[str]:
         except ValueError:
             return None
         if expires_at <= now:
-            connection.execute("DELETE FROM sessions WHERE token_hash = ?", (token_hash,))
+            connection.execute(_SQL_DELETE_SESSION, (token_hash,))
             return None
         return str(row[0])
 
 
-def save_model(username: str, df: pd.DataFrame) -> str:
+def _encode_model(model: pd.DataFrame | Mapping[str, Any]) -> bytes:
+    """Serialize a model as an Arrow IPC stream, preserving column dtypes."""
+    if isinstance(model, pd.DataFrame):
+        table = pa.Table.from_pandas(model, preserve_index=False)
+    else:
+        table = pa.table(dict(model))
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def _decode_model(data: bytes | str) -> pd.DataFrame:
+    if isinstance(data, str):
+        # Models saved before the Arrow format were stored as CSV text.
+        return pd.read_csv(StringIO(data))
+    return pa.ipc.open_stream(data).read_all().to_pandas()
+
+
+def save_model(username: str, model: pd.DataFrame | Mapping[str, Any]) -> str:
+    """Persist a model given as a DataFrame or a mapping of column arrays."""
     model_id = secrets.token_hex(16)
-    with get_connection() as connection:
-        connection.execute(
-            "INSERT INTO models (id, username, csv_data) VALUES (?, ?, ?)",
-            (model_id, username, df.to_csv(index=False)),
-        )
+    data = _encode_model(model)
+    with _connection() as connection:
+        connection.execute(_SQL_INSERT_MODEL, (model_id, username, data))
     return model_id
 
 
 def load_model(model_id: str, username: str) -> Optional[pd.DataFrame]:
-    with get_connection() as connection:
-        row = connection.execute(
-            "SELECT csv_data FROM models WHERE id = ? AND username = ?",
-            (model_id, username),
-        ).fetchone()
-    return None if row is None else pd.read_csv(StringIO(row[0]))
+    """Return the owner's saved model, or None.
+
+    Frames are cached and shared between callers, so treat them as
+    read-only.
+    """
+    with _model_cache_lock:
+        cached = _model_cache.get(model_id)
+    if cached is not None:
+        owner, df = cached
+        return df if owner == username else None
+    with _connection() as connection:
+        row = connection.execute(_SQL_SELECT_MODEL, (model_id, username)).fetchone()
+    if row is None:
+        return None
+    df = _decode_model(row[0])
+    with _model_cache_lock:
+        _model_cache[model_id] = (username, df)
+    return df
 
 
 def save_partner_request(name: str, email: str, message: str) -> None:
-    with get_connection() as connection:
-        connection.execute(
-            "INSERT INTO partner_requests (name, email, message) VALUES (?, ?, ?)",
-            (name, email, message),
-        )
+    with _connection() as connection:
+        connection.execute(_SQL_INSERT_PARTNER_REQUEST, (name, email, message))
+
+
+def save_partner_requests(requests: Iterable[tuple[str, str, str]]) -> None:
+    """Store many ``(name, email, message)`` inquiries in one transaction."""
+    with _connection() as connection:
+        connection.executemany(_SQL_INSERT_PARTNER_REQUEST, requests)
@@ -244,3 +244,28 @@ def test_registration_accepts_credentials_at_policy_boundaries(
         response = client.post("/register", json=credentials)
 
     assert response.status_code == 200
+
+
+def test_cached_export_is_not_served_to_another_user(monkeypatch, tmp_path):
+    monkeypatch.setattr(database, "DB_PATH", tmp_path / "app.db")
+
+    with TestClient(application.app) as client:
+        owner_token = _register_and_login(client, "cache-owner")
+        other_token = _register_and_login(client, "cache-other")
+        model_id = client.post(
+            "/generate",
+            headers={"Authorization": f"Bearer {owner_token}"},
+            json={"monthly_revenue": 10_000},
+        ).json()["model_id"]
+
+        for fmt in ("xlsx", "pdf"):
+            owner_export = client.get(
+                f"/export/{fmt}/{model_id}",
+                headers={"Authorization": f"Bearer {owner_token}"},
+            )
+            assert owner_export.status_code == 200
+            cross_owner = client.get(
+                f"/export/{fmt}/{model_id}",
+                headers={"Authorization": f"Bearer {other_token}"},
+            )
+            assert cross_owner.status_code == 404
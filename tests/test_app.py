@@ -0,0 +1,198 @@
+"""
+Tests for app.py helpers and the static page routes.
+
+Covers:
+  - Projection arithmetic and horizon
+  - Templates served from the in-memory cache loaded at startup
+  - JSON responses rendered with orjson
+  - XLSX and PDF export content, including non-finite values
+  - Roast summaries built from saved models
+  - Routes opt out of response-model validation
+  - Export render caching
+"""
+import io
+import zipfile
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+import app as application
+import database
+
+
+def test_projection_compounds_growth_monthly():
+    inputs = application.ProFormaInput(
+        monthly_revenue=1_000.0, growth_rate=0.1, cac=50.0, gross_margin=0.5
+    )
+    projection = application.create_projection(inputs)
+    assert list(projection) == ["month", "revenue", "gross_profit", "cac"]
+    assert projection["month"].tolist() == list(range(1, 13))
+    assert projection["revenue"][0] == pytest.approx(1_000.0)
+    assert projection["revenue"][11] == pytest.approx(1_000.0 * 1.1 ** 11)
+    assert projection["gross_profit"] == pytest.approx(projection["revenue"] * 0.5)
+    assert projection["cac"].tolist() == [50.0] * 12
+
+
+def test_projection_horizon_is_configurable():
+    inputs = application.ProFormaInput(monthly_revenue=1_000.0)
+    projection = application.create_projection(inputs, months=36)
+    assert all(len(column) == 36 for column in projection.values())
+
+
+@pytest.mark.parametrize("page", ["marketing", "auth", "dashboard"])
+def test_pages_are_served_from_loaded_templates(monkeypatch, tmp_path, page):
+    monkeypatch.setattr(database, "DB_PATH", tmp_path / "app.db")
+
+    with TestClient(application.app) as client:
+        assert f"{page}.html" in application._TEMPLATES
+        monkeypatch.setitem(application._TEMPLATES, f"{page}.html", "<p>cached</p>")
+        response = client.get(f"/{page}")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/html")
+    assert response.text == "<p>cached</p>"
+
+
+def test_json_routes_render_with_orjson(monkeypatch, tmp_path):
+    monkeypatch.setattr(database, "DB_PATH", tmp_path / "app.db")
+
+    with TestClient(application.app) as client:
+        response = client.post(
+            "/partner-request",
+            params={"name": "Acme VC", "email": "p@acme.com", "message": "Hi"},
+        )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.content == b'{"message":"Partner request submitted"}'
+
+
+def _register_and_login(client: TestClient, username: str) -> dict:
+    credentials = {"username": username, "password": "secure-password"}
+    assert client.post("/register", json=credentials).status_code == 200
+    token = client.post("/login", json=credentials).json()["token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_xlsx_export_contains_projection_sheet(monkeypatch, tmp_path):
+    monkeypatch.setattr(database, "DB_PATH", tmp_path / "app.db")
+
+    with TestClient(application.app) as client:
+        headers = _register_and_login(client, "xlsx-user")
+        model_id = client.post(
+            "/generate", headers=headers, json={"monthly_revenue": 10_000}
+        ).json()["model_id"]
+        response = client.get(f"/export/xlsx/{model_id}", headers=headers)
+
+    assert response.status_code == 200
+    with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+        workbook = archive.read("xl/workbook.xml").decode()
+        strings = archive.read("xl/sharedStrings.xml").decode()
+        sheet = archive.read("xl/worksheets/sheet1.xml").decode()
+    assert 'name="ProForma"' in workbook
+    for column in ("month", "revenue", "gross_profit", "cac"):
+        assert f">{column}<" in strings
+    assert '<row r="13"' in sheet
+    assert '<row r="14"' not in sheet
+
+
+def test_repeat_exports_render_once(monkeypatch, tmp_path):
+    monkeypatch.setattr(database, "DB_PATH", tmp_path / "app.db")
+    loads = []
+    real_load_model = database.load_model
+
+    def counting_load_model(model_id, username):
+        loads.append(model_id)
+        return real_load_model(model_id, username)
+
+    with TestClient(application.app) as client:
+        headers = _register_and_login(client, "cached-export-user")
+        model_id = client.post(
+            "/generate", headers=headers, json={"monthly_revenue": 10_000}
+        ).json()["model_id"]
+        monkeypatch.setattr(database, "load_model", counting_load_model)
+        for fmt in ("xlsx", "pdf"):
+            first = client.get(f"/export/{fmt}/{model_id}", headers=headers)
+            second = client.get(f"/export/{fmt}/{model_id}", headers=headers)
+            assert first.status_code == second.status_code == 200
+            assert first.content == second.content
+            assert first.headers["cache-control"] == "private, max-age=3600"
+
+    assert loads == [model_id, model_id]
+
+
+def test_pdf_export_is_a_pdf_document(monkeypatch, tmp_path):
+    monkeypatch.setattr(database, "DB_PATH", tmp_path / "app.db")
+
+    with TestClient(application.app) as client:
+        headers = _register_and_login(client, "pdf-user")
+        model_id = client.post(
+            "/generate", headers=headers, json={"monthly_revenue": 10_000}
+        ).json()["model_id"]
+        response = client.get(f"/export/pdf/{model_id}", headers=headers)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/pdf"
+    assert response.headers["content-disposition"] == (
+        f'attachment; filename="proforma_{model_id}.pdf"'
+    )
+    assert response.content.startswith(b"%PDF")
+
+
+def test_roast_summarizes_saved_model(monkeypatch, tmp_path):
+    monkeypatch.setattr(database, "DB_PATH", tmp_path / "app.db")
+    summaries = []
+    monkeypatch.setattr(application.agent, "roast", lambda summary: summaries.append(summary) or "ouch")
+
+    with TestClient(application.app) as client:
+        headers = _register_and_login(client, "roast-user")
+        model_id = client.post(
+            "/generate",
+            headers=headers,
+            json={"monthly_revenue": 10_000, "growth_rate": 0.0},
+        ).json()["model_id"]
+        response = client.post("/roast", headers=headers, json={"model_id": model_id})
+        missing = client.post("/roast", headers=headers, json={"model_id": "missing"})
+
+    assert response.status_code == 200
+    assert response.json() == {"critique": "ouch"}
+    assert summaries == ["A 12‑month projection with total revenue of $120,000."]
+    assert missing.status_code == 404
+
+
+def test_routes_skip_response_model_validation():
+    routes = [route for route in application.app.routes if route.path in {
+        "/marketing", "/auth", "/dashboard", "/register", "/login", "/generate",
+        "/export/xlsx/{model_id}", "/export/pdf/{model_id}", "/roast", "/partner-request",
+    }]
+    assert len(routes) == 10
+    assert all(route.response_model is None for route in routes)
+
+
+@pytest.mark.filterwarnings("ignore:overflow encountered:RuntimeWarning")
+def test_xlsx_export_writes_non_finite_values(monkeypatch, tmp_path):
+    monkeypatch.setattr(database, "DB_PATH", tmp_path / "app.db")
+
+    with TestClient(application.app) as client:
+        headers = _register_and_login(client, "non-finite-user")
+        # Passes input validation but overflows revenue to inf late in the year
+        overflowed_id = client.post(
+            "/generate",
+            headers=headers,
+            json={"monthly_revenue": 1e306, "growth_rate": 1.0},
+        ).json()["model_id"]
+        nan_id = database.save_model(
+            "non-finite-user",
+            {"month": np.array([1, 2]), "revenue": np.array([1.0, np.nan])},
+        )
+        overflowed = client.get(f"/export/xlsx/{overflowed_id}", headers=headers)
+        with_nan = client.get(f"/export/xlsx/{nan_id}", headers=headers)
+
+    assert overflowed.status_code == 200
+    with zipfile.ZipFile(io.BytesIO(overflowed.content)) as archive:
+        assert ">inf<" in archive.read("xl/sharedStrings.xml").decode()
+    assert with_nan.status_code == 200
+    with zipfile.ZipFile(io.BytesIO(with_nan.content)) as archive:
+        sheet = archive.read("xl/worksheets/sheet1.xml").decode()
+    assert '<c r="B3"' not in sheet
@@ -166,6 +166,19 @@ class TestCashflows:
         )
         assert isinstance(result["irr"], float)
 
+    def test_irr_matches_generic_solver_for_level_net_income(self):
+        from server.models import finance
+
+        inputs = _make_single_analyst(tax_rate=0.26, equity_investment=50_000.0)
+        result = calculate_income_statement(inputs, years=5)
+        assert result["irr"] == pytest.approx(finance.irr(result["cashflows"]), abs=1e-6)
+
+    def test_irr_is_none_when_net_income_is_not_positive(self):
+        inputs = _make_single_analyst(salary=500_000.0, equity_investment=100_000.0)
+        result = calculate_income_statement(inputs, years=5)
+        assert result["net_income"] < 0
+        assert result["irr"] is None
+
 
 # ── Smoke test ────────────────────────────────────────────────────────────────
 
@@ -176,3 +189,31 @@ def test_example_inputs_runs_and_produces_valid_result():
     assert "net_income" in result
     assert "cashflows" in result
     assert len(result["cashflows"]) == 6  # default years=5
+
+
+def test_example_inputs_is_a_shared_frozen_instance():
+    import dataclasses
+
+    inputs = example_inputs()
+    assert example_inputs() is inputs
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        inputs.tax_rate = 0.0
+
+
+def test_example_inputs_serializes_with_asdict():
+    import copy
+    import dataclasses
+    import pickle
+
+    inputs = example_inputs()
+    as_dict = dataclasses.asdict(inputs)
+    assert as_dict["overhead"]["rent"] == 300_000.0
+    assert as_dict["partners"]["headcount"] == 3
+    assert copy.deepcopy(inputs) == inputs
+    assert pickle.loads(pickle.dumps(inputs)) == inputs
+
+
+def test_input_dataclasses_use_slots():
+    inputs = _make_single_analyst()
+    assert not hasattr(inputs, "__dict__")
+    assert not hasattr(inputs.analysts, "__dict__")
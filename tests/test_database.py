@@ -250,6 +250,35 @@ def test_connections_wait_for_parallel_initializers():
     assert busy_timeout == database._SQLITE_BUSY_TIMEOUT_MS
 
 
+def test_connections_use_wal_journal():
+    import database
+
+    with database.get_connection() as connection:
+        journal_mode = connection.execute("PRAGMA journal_mode").fetchone()[0]
+
+    assert journal_mode == "wal"
+
+
+def test_runtime_queries_reuse_one_connection(monkeypatch):
+    import database
+
+    opened = []
+    real_get_connection = database.get_connection
+
+    def counting_get_connection():
+        opened.append(True)
+        return real_get_connection()
+
+    monkeypatch.setattr(database, "get_connection", counting_get_connection)
+    database.create_user("pooled", "password123")
+    assert database.authenticate_user("pooled", "password123") is True
+    token = database.create_session("pooled")
+    assert database.resolve_session(token) == "pooled"
+    database.save_partner_request("Acme", "a@acme.com", "Hi")
+
+    assert len(opened) == 1
+
+
 def test_session_resolves_to_owner():
     import database
     database.create_user("session-user", "password123")
@@ -295,6 +324,56 @@ def test_load_model_roundtrip_preserves_values():
     assert abs(loaded["x"].iloc[2] - 3.5) < 1e-9
 
 
+def test_load_model_roundtrip_preserves_dtypes():
+    import database
+    database.create_user("user1", "password123")
+    df = pd.DataFrame({"month": [1, 2, 3], "revenue": [1000.0, 1050.0, 1102.5]})
+    model_id = database.save_model("user1", df)
+    loaded = database.load_model(model_id, "user1")
+    pd.testing.assert_frame_equal(loaded, df)
+
+
+def test_save_model_accepts_column_arrays():
+    import numpy as np
+    import database
+    database.create_user("user1", "password123")
+    model_id = database.save_model(
+        "user1", {"month": np.arange(1, 4), "revenue": np.array([1.0, 2.0, 3.0])}
+    )
+    loaded = database.load_model(model_id, "user1")
+    pd.testing.assert_frame_equal(
+        loaded, pd.DataFrame({"month": [1, 2, 3], "revenue": [1.0, 2.0, 3.0]})
+    )
+
+
+def test_init_db_keeps_legacy_csv_models_readable():
+    import database
+
+    database.DB_PATH.unlink()
+    with sqlite3.connect(database.DB_PATH) as connection:
+        connection.execute(
+            """
+            CREATE TABLE models (
+                id TEXT PRIMARY KEY,
+                username TEXT NOT NULL,
+                csv_data TEXT NOT NULL
+            )
+            """
+        )
+        connection.execute(
+            "INSERT INTO models (id, username, csv_data) VALUES (?, ?, ?)",
+            ("legacy-model", "user1", "month,revenue\n1,1000.0\n2,1050.0\n"),
+        )
+
+    database.init_db()
+    database.create_user("user1", "password123")
+
+    legacy = database.load_model("legacy-model", "user1")
+    assert legacy["revenue"].tolist() == [1000.0, 1050.0]
+    model_id = database.save_model("user1", pd.DataFrame({"v": [1.5]}))
+    assert database.load_model(model_id, "user1")["v"].tolist() == [1.5]
+
+
 def test_load_nonexistent_model_returns_none():
     import database
     assert database.load_model("does_not_exist_abc123", "user1") is None
@@ -332,3 +411,62 @@ def test_save_multiple_partner_requests():
     import database
     for i in range(3):
         database.save_partner_request(f"Partner {i}", f"p{i}@example.com", "Hello")
+
+
+def test_save_partner_requests_inserts_batch():
+    import database
+    database.save_partner_requests(
+        [(f"Partner {i}", f"p{i}@example.com", "Hello") for i in range(3)]
+    )
+    with database.get_connection() as connection:
+        names = [
+            row[0]
+            for row in connection.execute(
+                "SELECT name FROM partner_requests ORDER BY id"
+            ).fetchall()
+        ]
+    assert names == ["Partner 0", "Partner 1", "Partner 2"]
+
+
+def test_repeat_login_within_ttl_skips_password_check(monkeypatch):
+    import database
+    database.create_user("cached-login", "password123")
+    assert database.authenticate_user("cached-login", "password123") is True
+
+    def fail_verify(password, encoded):
+        raise AssertionError("cached login should not re-verify")
+
+    monkeypatch.setattr(database, "_verify_password", fail_verify)
+    assert database.authenticate_user("cached-login", "password123") is True
+
+
+def test_failed_logins_are_not_cached():
+    import database
+    database.create_user("uncached-login", "password123")
+    assert database.authenticate_user("uncached-login", "wrong-password") is False
+    assert database.authenticate_user("uncached-login", "wrong-password") is False
+    assert database.authenticate_user("uncached-login", "password123") is True
+
+
+def test_init_db_forgets_cached_logins():
+    import database
+    database.create_user("restarted", "password123")
+    assert database.authenticate_user("restarted", "password123") is True
+    database.DB_PATH.unlink()
+    database.init_db()
+    assert database.authenticate_user("restarted", "password123") is False
+
+
+def test_repeat_model_loads_skip_the_database(monkeypatch):
+    import database
+    database.create_user("owner", "password123")
+    database.create_user("intruder", "password123")
+    model_id = database.save_model("owner", pd.DataFrame({"v": [1.5]}))
+    first = database.load_model(model_id, "owner")
+
+    def fail_decode(data):
+        raise AssertionError("cached model should not be decoded again")
+
+    monkeypatch.setattr(database, "_decode_model", fail_decode)
+    assert database.load_model(model_id, "owner") is first
+    assert database.load_model(model_id, "intruder") is None
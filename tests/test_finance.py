@@ -0,0 +1,75 @@
+"""
+Tests for server/models/finance.py
+
+Covers:
+  - IRR against known closed-form answers
+  - Newton fallback when numpy_financial is unavailable, including negative rates
+  - None for cash flows without a sign change
+"""
+import pytest
+
+from server.models import finance
+
+
+@pytest.fixture(params=["numpy_financial", "newton"])
+def irr_backend(request, monkeypatch):
+    if request.param == "newton":
+        monkeypatch.setattr(finance, "npf", None)
+    return request.param
+
+
+def test_single_period_irr(irr_backend):
+    assert finance.irr([-100.0, 110.0]) == pytest.approx(0.10, abs=1e-6)
+
+
+def test_annuity_irr(irr_backend):
+    # 1000 invested for five payments of 263.797... returns exactly 10%
+    payment = 1000 * 0.1 / (1 - 1.1 ** -5)
+    assert finance.irr([-1000.0] + [payment] * 5) == pytest.approx(0.10, abs=1e-6)
+
+
+def test_negative_irr(irr_backend):
+    # 100 returning 10 a year for three years loses money: r = -0.4244...
+    assert finance.irr([-100.0, 10.0, 10.0, 10.0]) == pytest.approx(-0.424417, abs=1e-6)
+
+
+def test_negative_irr_with_late_positive_cashflows(irr_backend):
+    # Years of negative cash before a payback tail: NPV turns back up at high
+    # rates, so an unseeded Newton step from +10% walks away from the root.
+    cashflows = [-26.85] + [-2.0] * 18 + [2.0] * 12
+    expected = -0.0511820
+    assert finance.irr(cashflows) == pytest.approx(expected, abs=1e-6)
+
+
+def test_backends_agree_on_uneven_cashflows(monkeypatch):
+    cashflows = [-5_000.0, 800.0, 1_200.0, 1_500.0, 2_000.0, 2_500.0]
+    expected = finance.irr(cashflows)
+    monkeypatch.setattr(finance, "npf", None)
+    assert finance.irr(cashflows) == pytest.approx(expected, abs=1e-6)
+
+
+def test_no_sign_change_returns_none(irr_backend):
+    assert finance.irr([100.0, 100.0, 100.0]) is None
+
+
+@pytest.mark.parametrize(
+    ("investment", "payment", "periods"),
+    [
+        (1_000.0, 263.797, 5),
+        (1_000.0, 150.0, 5),
+        (500_000.0, 1_200_000.0, 5),
+        (1_000.0, 100.0, 30),
+        (1_000.0, 500.0, 1),
+    ],
+)
+def test_annuity_irr_matches_generic_irr(investment, payment, periods):
+    expected = finance.irr([-investment] + [payment] * periods)
+    assert finance.annuity_irr(investment, payment, periods) == pytest.approx(expected, abs=1e-6)
+
+
+@pytest.mark.parametrize(
+    ("investment", "payment", "periods"),
+    [(0.0, 100.0, 5), (1_000.0, 0.0, 5), (1_000.0, -50.0, 5), (1_000.0, 100.0, 0)],
+)
+def test_annuity_irr_without_solution_returns_none(investment, payment, periods):
+    assert finance.annuity_irr(investment, payment, periods) is None
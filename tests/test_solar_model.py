@@ -139,6 +139,17 @@ class TestOperatingCostsAndDebt:
         expected_principal = levered["debt_amount"] / 5
         assert unlevered["cashflows"][1] - levered["cashflows"][1] == pytest.approx(expected_principal)
 
+    @pytest.mark.parametrize("rate", [0.0, 0.05])
+    def test_debt_service_matches_level_annuity_then_stops(self, rate):
+        common = dict(debt_interest_rate=rate, debt_tenor_years=5, tax_rate=0.0)
+        unlevered = calculate_cashflows(_make_solar(debt_fraction=0.0, **common), years=8)
+        levered = calculate_cashflows(_make_solar(debt_fraction=0.5, **common), years=8)
+        debt = levered["debt_amount"]
+        payment = debt / 5 if rate == 0 else debt * rate / (1 - (1 + rate) ** -5)
+        debt_service = [u - l for u, l in zip(unlevered["cashflows"][1:], levered["cashflows"][1:])]
+        assert debt_service[:5] == pytest.approx([payment] * 5)
+        assert debt_service[5:] == pytest.approx([0.0] * 3, abs=1e-6)
+
     def test_invalid_fraction_is_rejected(self):
         with pytest.raises(ValueError, match="debt_fraction"):
             calculate_cashflows(_make_solar(debt_fraction=1.2), years=5)
@@ -175,3 +186,16 @@ def test_example_inputs_runs_and_produces_valid_result():
     assert result["capex"] > 0
     assert result["equity_amount"] > 0
     assert len(result["cashflows"]) == 31
+
+
+def test_example_inputs_is_a_shared_frozen_instance():
+    import dataclasses
+
+    inputs = example_inputs()
+    assert example_inputs() is inputs
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        inputs.tax_rate = 0.0
+
+
+def test_input_dataclasses_use_slots():
+    assert not hasattr(_make_solar(), "__dict__")
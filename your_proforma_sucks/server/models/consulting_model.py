@@ -15,8 +15,10 @@ from dataclasses import dataclass
 from typing import Dict, List, Any
 import numpy as np
 
+from . import finance
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class StaffLevel:
     headcount: int
     billing_rate: float  # $/hour
@@ -25,7 +27,7 @@ class StaffLevel:
     realization: float  # fraction of billed hours collected as revenue
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ConsultingInputs:
     partners: StaffLevel
     managers: StaffLevel
@@ -78,16 +80,12 @@ def calculate_income_statement(inputs: ConsultingInputs, years: int = 5) -> Dict
     tax = taxable_income * inputs.tax_rate
     net_income = ebitda - tax
 
-    # Build cashflows for IRR: equity investment at year 0 equals zero (assuming financing covers working capital) and subsequent cash flows equal net income
-    cashflows = [-inputs.financing.get("equity_investment", 0.0)]
-    for _ in range(years):
-        cashflows.append(net_income)
+    # Build cashflows for IRR: equity investment at year 0 equals zero (assuming financing covers working capital) and subsequent cashflows equal net income
+    equity_investment = inputs.financing.get("equity_investment", 0.0)
+    cashflows = [-equity_investment] + [net_income] * years
 
-    try:
-        import numpy_financial as npf
-        irr = float(npf.irr(cashflows))
-    except Exception:
-        irr = None
+    # Constant net income makes this a level annuity, so solve that directly
+    irr = finance.annuity_irr(equity_investment, net_income, years) if net_income > 0 else None
 
     return {
         "annual_revenue": annual_revenue,
@@ -101,37 +99,38 @@ def calculate_income_statement(inputs: ConsultingInputs, years: int = 5) -> Dict
     }
 
 
-def example_inputs() -> ConsultingInputs:
-    """Provide a sample consulting firm input set for demonstration purposes."""
-    partners = StaffLevel(headcount=3, billing_rate=350.0, salary=250_000.0, utilization=0.6, realization=0.9)
-    managers = StaffLevel(headcount=6, billing_rate=250.0, salary=150_000.0, utilization=0.7, realization=0.9)
-    analysts = StaffLevel(headcount=12, billing_rate=150.0, salary=90_000.0, utilization=0.8, realization=0.85)
-    overhead = {
+_EXAMPLE_INPUTS = ConsultingInputs(
+    partners=StaffLevel(headcount=3, billing_rate=350.0, salary=250_000.0, utilization=0.6, realization=0.9),
+    managers=StaffLevel(headcount=6, billing_rate=250.0, salary=150_000.0, utilization=0.7, realization=0.9),
+    analysts=StaffLevel(headcount=12, billing_rate=150.0, salary=90_000.0, utilization=0.8, realization=0.85),
+    retainer_fraction=0.6,
+    project_fraction=0.4,
+    overhead={
         "rent": 300_000.0,
         "software": 100_000.0,
         "marketing": 200_000.0,
         "travel": 150_000.0,
         "admin_salaries": 400_000.0
-    }
-    working_capital = {
+    },
+    working_capital={
         "wip_days": 30,
         "ar_days": 45,
         "ap_days": 15
-    }
-    financing = {
+    },
+    financing={
         "equity_investment": 1_000_000.0,
         "debt_amount": 0.0,
         "debt_interest_rate": 0.0,
         "debt_term": 0
-    }
-    return ConsultingInputs(
-        partners=partners,
-        managers=managers,
-        analysts=analysts,
-        retainer_fraction=0.6,
-        project_fraction=0.4,
-        overhead=overhead,
-        working_capital=working_capital,
-        financing=financing,
-        tax_rate=0.26
-    )
+    },
+    tax_rate=0.26
+)
+
+
+def example_inputs() -> ConsultingInputs:
+    """Provide a sample consulting firm input set for demonstration purposes.
+
+    The inputs are frozen, so the same instance is shared by every caller;
+    treat its overhead, working-capital and financing dicts as read-only.
+    """
+    return _EXAMPLE_INPUTS
@@ -0,0 +1,125 @@
+"""
+Shared financial helpers for the template models.
+
+The solar and consulting models both report an equity IRR. ``np.irr`` was
+removed in NumPy 1.20, so this module wraps ``numpy_financial.irr`` when it is
+installed and otherwise falls back to a small Newton-Raphson solver on the NPV
+polynomial.
+"""
+
+from __future__ import annotations
+
+from typing import Optional, Sequence
+
+import numpy as np
+
+try:
+    import numpy_financial as npf
+except ImportError:  # pragma: no cover - exercised via monkeypatch in tests
+    npf = None
+
+
+# Growth factors 1 + r scanned to seed the Newton fallback, covering
+# rates from -99% to +1000%.
+_IRR_SCAN_GROWTH = np.geomspace(0.01, 11.0, 400)
+
+
+def _irr_seed(cfs: np.ndarray, t: np.ndarray) -> Optional[float]:
+    """Return a rate near the NPV root closest to zero, or None if none is seen.
+
+    NPV is evaluated on the whole scan grid at once; the sign change nearest
+    0% is interpolated linearly. Preferring that root matches
+    ``numpy_financial.irr`` when the cash flows have several.
+    """
+    with np.errstate(over="ignore", invalid="ignore"):
+        npv = (_IRR_SCAN_GROWTH[:, None] ** -t) @ cfs
+    rates = _IRR_SCAN_GROWTH - 1
+    lo = np.flatnonzero(np.isfinite(npv[:-1]) & np.isfinite(npv[1:]) & (npv[:-1] * npv[1:] <= 0))
+    if lo.size == 0:
+        return None
+    i = lo[np.argmin(np.abs(rates[lo]))]
+    if npv[i] == npv[i + 1]:
+        return float(rates[i])
+    return float(rates[i] - npv[i] * (rates[i + 1] - rates[i]) / (npv[i + 1] - npv[i]))
+
+
+def irr(
+    cashflows: Sequence[float],
+    guess: Optional[float] = None,
+    tol: float = 1e-6,
+    max_iter: int = 50,
+) -> Optional[float]:
+    """Return the internal rate of return of ``cashflows`` or None.
+
+    Args:
+        cashflows: Periodic cash flows starting at period 0.
+        guess: Starting rate for the Newton fallback. By default it is seeded
+            from a scan of NPV over a grid of rates.
+        tol: Convergence tolerance on the rate for the Newton fallback.
+        max_iter: Iteration cap for the Newton fallback.
+
+    Returns:
+        The IRR as a float, or None when no rate could be found.
+    """
+    cfs = np.asarray(cashflows, dtype=float)
+    if npf is not None:
+        value = float(npf.irr(cfs))
+        return value if value == value else None  # filter NaN
+
+    if not (cfs.min() < 0 < cfs.max()):
+        return None
+    t = np.arange(len(cfs))
+    r = _irr_seed(cfs, t) if guess is None else guess
+    if r is None:
+        return None
+    for _ in range(max_iter):
+        discount = (1 + r) ** -t
+        npv = (cfs * discount).sum()
+        dnpv = (-t * cfs * discount / (1 + r)).sum()
+        if dnpv == 0:
+            return None
+        step = npv / dnpv
+        # Keep the iterate above -1 by halving the distance instead
+        r = r - step if r - step > -1 else (r - 1) / 2
+        if abs(step) < tol:
+            return float(r)
+    return None
+
+
+def annuity_irr(
+    investment: float,
+    payment: float,
+    periods: int,
+    tol: float = 1e-6,
+    max_iter: int = 50,
+) -> Optional[float]:
+    """Return the IRR of ``investment`` repaid by ``periods`` level payments.
+
+    Equivalent to ``irr([-investment] + [payment] * periods)`` but solves the
+    annuity equation ``investment = payment * (1 - (1 + r) ** -n) / r`` on a
+    scalar, starting from the rate that grows ``investment`` into the summed
+    payments over their mean timing.
+
+    Returns:
+        The IRR as a float, or None when the inputs have no positive-payment
+        solution.
+    """
+    if investment <= 0 or payment <= 0 or periods < 1:
+        return None
+    n = periods
+    r = (payment * n / investment) ** (2 / (n + 1)) - 1
+    for _ in range(max_iter):
+        if r == 0:
+            f = payment * n - investment
+            df = -payment * n * (n + 1) / 2
+        else:
+            v = (1 + r) ** -n
+            annuity = (1 - v) / r
+            f = payment * annuity - investment
+            df = payment * (n * v / (1 + r) - annuity) / r
+        step = f / df
+        # Keep the iterate above -1 by halving the distance instead
+        r = r - step if r - step > -1 else (r - 1) / 2
+        if abs(step) < tol:
+            return float(r)
+    return None
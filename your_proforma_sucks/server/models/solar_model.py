@@ -2,9 +2,9 @@
 Solar project financial model.
 
 This module contains helper functions to compute basic financial outputs for a
-utility‑scale solar PV project based on the assumption schema defined in
+utility-scale solar PV project based on the assumption schema defined in
 `schemas/v1/solar.json`. It is not intended to replace a full
-project‑finance model, but rather to provide reasonable first‑order
+project-finance model, but rather to provide reasonable first-order
 calculations that can be surfaced in the web app.
 
 The core entry point is ``calculate_cashflows`` which accepts a dictionary of
@@ -18,8 +18,10 @@ from dataclasses import dataclass
 from typing import Dict, List, Any
 import numpy as np
 
+from . import finance
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class SolarInputs:
     ac_mw: float
     dc_mw: float
@@ -68,28 +70,21 @@ def calculate_cashflows(inputs: SolarInputs, years: int = 30) -> Dict[str, Any]:
     if inputs.debt_fraction > 0 and inputs.debt_tenor_years < 1:
         raise ValueError("debt_tenor_years must be positive when debt is used")
 
-    # Capacity and production
+    years_idx = np.arange(years)
+
+    # Capacity and production, degrading energy each year
     ac_kw = inputs.ac_mw * 1_000
-    annual_production_mwh = []
-    for year in range(years):
-        # degrade energy each year
-        effective_cf = inputs.capacity_factor * ((1 - inputs.degradation) ** year)
-        energy = ac_kw * effective_cf * 8760 / 1000  # MWh
-        annual_production_mwh.append(energy)
-
-    # Revenue
-    annual_revenue = []
-    ppa_price = inputs.ppa_price
-    for year, energy in enumerate(annual_production_mwh):
-        ppa_energy = energy * (1 - inputs.merchant_percentage)
-        merchant_energy = energy * inputs.merchant_percentage
-        revenue = (ppa_energy * ppa_price) + (merchant_energy * inputs.merchant_price)
-        annual_revenue.append(revenue)
-        ppa_price *= 1 + inputs.ppa_escalator  # Escalate PPA each year
+    deg_factor = (1 - inputs.degradation) ** years_idx
+    annual_production_mwh = ac_kw * inputs.capacity_factor * deg_factor * 8760 / 1000  # MWh
+
+    # Revenue, escalating the PPA price each year
+    ppa_schedule = inputs.ppa_price * (1 + inputs.ppa_escalator) ** years_idx
+    mp = inputs.merchant_percentage
+    annual_revenue = annual_production_mwh * ((1 - mp) * ppa_schedule + mp * inputs.merchant_price)
 
     # O&M
     annual_om_cost = ac_kw * (inputs.fixed_om_per_kw + inputs.insurance_per_kw)
-    opex = [annual_om_cost for _ in range(years)]
+    opex = np.full(years, annual_om_cost)
 
     # CapEx
     base_capex_per_kw = inputs.module_cost_per_kw + inputs.inverter_cost_per_kw + inputs.bos_cost_per_kw
@@ -99,49 +94,45 @@ def calculate_cashflows(inputs: SolarInputs, years: int = 30) -> Dict[str, Any]:
     itc_value = total_capex * inputs.itc_percent
     net_capex = total_capex - itc_value
 
-    # Financing: simple assumption – debt draws at COD and interest paid annually on outstanding balance.
+    # Financing: simple assumption - debt draws at COD and interest paid annually on outstanding balance.
     debt_amount = net_capex * inputs.debt_fraction
     equity_amount = net_capex - debt_amount
-    # Debt amortization – simple mortgage style payment with equal annual payments over tenor
+    ebitda = annual_revenue - opex
+    # Depreciation - simplified straight line over 5 years on net capex
+    depreciation = (years_idx < 5) * (net_capex / 5)
+
+    # Debt amortization - level annual payments over the tenor. The balance
+    # at the start of year t has the closed form
+    # B_t = D * ((1 + r)^n - (1 + r)^t) / ((1 + r)^n - 1), which is zero from
+    # the end of the tenor onwards, so no per-year balance loop is needed.
     if inputs.debt_fraction > 0:
         rate = inputs.debt_interest_rate
         n = inputs.debt_tenor_years
+        elapsed = np.minimum(years_idx, n)
         if rate == 0:
             annual_debt_payment = debt_amount / n
+            opening_balance = debt_amount * (1 - elapsed / n)
         else:
-            annuity_factor = (rate * (1 + rate) ** n) / ((1 + rate) ** n - 1)
+            growth_n = (1 + rate) ** n
+            annuity_factor = (rate * growth_n) / (growth_n - 1)
             annual_debt_payment = debt_amount * annuity_factor
+            opening_balance = debt_amount * (growth_n - (1 + rate) ** elapsed) / (growth_n - 1)
+        interest = opening_balance * rate
+        principal = (years_idx < n) * (annual_debt_payment - interest)
     else:
-        annual_debt_payment = 0.0
+        interest = np.zeros(years)
+        principal = np.zeros(years)
+
+    taxable_income = np.maximum(0.0, ebitda - depreciation - interest)
+    tax = taxable_income * inputs.tax_rate
+    cashflow_to_equity = ebitda - tax - interest - principal
 
     # Cashflows: year 0 negative equity investment followed by yearly equity cashflows
-    cashflows: List[float] = [-equity_amount]
-    debt_balance = debt_amount
-    for year in range(years):
-        # Revenue minus O&M
-        ebitda = annual_revenue[year] - opex[year]
-        # Depreciation – simplified straight line over 5 years on net capex
-        depreciation = net_capex / 5 if year < 5 else 0.0
-        # Interest expense on outstanding debt
-        interest = debt_balance * inputs.debt_interest_rate
-        # Principal payment if within tenor
-        principal = min(
-            debt_balance,
-            max(0.0, annual_debt_payment - interest),
-        ) if year < inputs.debt_tenor_years else 0.0
-        # Adjust debt balance
-        debt_balance = max(0.0, debt_balance - principal)
-        taxable_income = max(0.0, ebitda - depreciation - interest)
-        tax = taxable_income * inputs.tax_rate
-        cashflow_to_equity = ebitda - tax - interest - principal
-        cashflows.append(cashflow_to_equity)
-    # Calculate equity IRR using numpy_financial (np.irr was removed in NumPy >= 1.20)
-    try:
-        import numpy_financial as npf
-        irr_val = float(npf.irr(cashflows))
-        irr = irr_val if irr_val == irr_val else None
-    except Exception:
-        irr = None
+    cashflows: List[float] = [-equity_amount] + cashflow_to_equity.tolist()
+
+    # Calculate equity IRR (np.irr was removed in NumPy >= 1.20)
+    irr = finance.irr(cashflows)
+
     return {
         "cashflows": cashflows,
         "irr": irr,
@@ -151,30 +142,36 @@ def calculate_cashflows(inputs: SolarInputs, years: int = 30) -> Dict[str, Any]:
     }
 
 
+_EXAMPLE_INPUTS = SolarInputs(
+    ac_mw=100,
+    dc_mw=130,
+    capacity_factor=0.25,
+    degradation=0.005,
+    fixed_om_per_kw=23.0,
+    insurance_per_kw=2.0,
+    ppa_price=30.0,
+    ppa_escalator=0.02,
+    merchant_percentage=0.1,
+    merchant_price=40.0,
+    debt_fraction=0.6,
+    debt_interest_rate=0.05,
+    debt_tenor_years=18,
+    equity_return_target=0.12,
+    tax_rate=0.26,
+    itc_percent=0.30,
+    module_cost_per_kw=350.0,
+    inverter_cost_per_kw=60.0,
+    bos_cost_per_kw=200.0,
+    interconnect_cost=5_000_000,
+    land_cost=1_500_000,
+    development_cost=3_000_000,
+    contingency_percent=0.08
+)
+
+
 def example_inputs() -> SolarInputs:
-    """Return a set of reasonable default inputs for demonstration."""
-    return SolarInputs(
-        ac_mw=100,
-        dc_mw=130,
-        capacity_factor=0.25,
-        degradation=0.005,
-        fixed_om_per_kw=23.0,
-        insurance_per_kw=2.0,
-        ppa_price=30.0,
-        ppa_escalator=0.02,
-        merchant_percentage=0.1,
-        merchant_price=40.0,
-        debt_fraction=0.6,
-        debt_interest_rate=0.05,
-        debt_tenor_years=18,
-        equity_return_target=0.12,
-        tax_rate=0.26,
-        itc_percent=0.30,
-        module_cost_per_kw=350.0,
-        inverter_cost_per_kw=60.0,
-        bos_cost_per_kw=200.0,
-        interconnect_cost=5_000_000,
-        land_cost=1_500_000,
-        development_cost=3_000_000,
-        contingency_percent=0.08
-    )
+    """Return a set of reasonable default inputs for demonstration.
+
+    The inputs are frozen, so the same instance is shared by every caller.
+    """
+    return _EXAMPLE_INPUTS